@@ -163,5 +163,5 @@ print(f"Cost of the expansion: {system.expansion_cost * 1e-6:.2f}M USD")
 
 print("\nLines to be constructed:")
 for i, line in enumerate(system.transmission_lines):
-    if int(round(system.line_control[str(i)].X)):
+    if int(round(system.x.X[i])):
         print(line._id)
@@ -6,10 +6,9 @@ nodes, and transmission lines.
 """
 
 from dataclasses import dataclass
-import numpy as np
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class PowerPlant:
     """
     Represents a power plant.
@@ -21,11 +20,8 @@ class PowerPlant:
     _id: int
     capacity: float
 
-    def __hash__(self):
-        return hash(self._id)
 
-
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class Load:
     """
     Represents a load.
@@ -36,7 +32,7 @@ class Load:
     value: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class Node:
     """
     Represents a node.
@@ -51,9 +47,6 @@ class Node:
     loads: list[Load]
     power_plants: list[PowerPlant]
 
-    def __hash__(self):
-        return hash(self._id)
-
     @property
     def total_generation_capacity(self) -> float:
         """
@@ -62,7 +55,7 @@ class Node:
         :return: The total generation capacity.
         :rtype: float
         """
-        return np.sum([plant.capacity for plant in self.power_plants])
+        return sum(plant.capacity for plant in self.power_plants)
 
     @property
     def total_load(self) -> float:
@@ -72,10 +65,10 @@ class Node:
         :return: The total load.
         :rtype: float
         """
-        return np.sum([load.value for load in self.loads])
+        return sum(load.value for load in self.loads)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class TransmissionLine:
     """
     Represents a transmission line.
@@ -89,7 +82,9 @@ class TransmissionLine:
     :param float cost_per_mile: The cost per mile of the transmission line.
         Default is 1e6.
     :param bool is_real: Indicates if the transmission line exists or not.
-        Default is False.
+        An existing line always carries flow, and building it again adds
+        a second, parallel circuit on the same corridor. Default is
+        False.
     """
 
     _id: str
@@ -101,9 +96,6 @@ class TransmissionLine:
     cost_per_mile: float = 1e6
     is_real: bool = False
 
-    def __hash__(self):
-        return hash(self._id)
-
     @property
     def capital_cost(self) -> float:
         """
@@ -5,11 +5,228 @@ This module defines the System class for representing a power system and
 performing optimization.
 """
 
+import os
+import time
+from functools import cached_property
+from operator import attrgetter
+
 import gurobipy as gb
 import numpy as np
+import scipy.sparse as sp
 
 from tepe.models import Node, PowerPlant, TransmissionLine
 
+# Tuned solver parameters persisted by System.tune() and picked up by
+# later model compilations:
+PARAMETER_FILE = "tep.prm"
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to pure Python.
+
+    def njit(*args, **_kwargs):
+        """
+        No-op replacement for numba.njit when Numba is not installed.
+        """
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, boundscheck=False)
+def _union_find_root(parent: np.ndarray, i: int) -> int:
+    """
+    Find the union-find root of node ``i``, halving paths on the way.
+
+    :param np.ndarray parent: The union-find parent array.
+    :param int i: The node index.
+    :return: The root index.
+    :rtype: int
+    """
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+
+    return i
+
+
+@njit(cache=True, boundscheck=False)
+def _max_flow(residual: np.ndarray, source: int, sink: int) -> float:
+    """
+    Compute the maximum flow from ``source`` to ``sink`` over a dense
+    residual capacity matrix, with the Edmonds-Karp algorithm. The
+    matrix is consumed in place.
+
+    :param np.ndarray residual: The residual capacity matrix.
+    :param int source: The source node index.
+    :param int sink: The sink node index.
+    :return: The maximum flow.
+    :rtype: float
+    """
+    size = residual.shape[0]
+    parent = np.empty(size, dtype=np.int64)
+    queue = np.empty(size, dtype=np.int64)
+    flow = 0.0
+
+    while True:
+        parent[:] = -1
+        parent[source] = source
+        queue[0] = source
+        head = 0
+        tail = 1
+
+        while head < tail and parent[sink] == -1:
+            u = queue[head]
+            head += 1
+
+            for v in range(size):
+                if parent[v] == -1 and residual[u, v] > 1e-9:
+                    parent[v] = u
+                    queue[tail] = v
+                    tail += 1
+
+        if parent[sink] == -1:
+            return flow
+
+        push = np.inf
+        v = sink
+
+        while v != source:
+            u = parent[v]
+
+            if residual[u, v] < push:
+                push = residual[u, v]
+
+            v = u
+
+        v = sink
+
+        while v != source:
+            u = parent[v]
+            residual[u, v] -= push
+            residual[v, u] += push
+            v = u
+
+        flow += push
+
+
+@njit(cache=True, boundscheck=False)
+def _deliverable_load(
+    start_idx: np.ndarray,
+    end_idx: np.ndarray,
+    capacity_pu: np.ndarray,
+    is_real: np.ndarray,
+    build: np.ndarray,
+    generation_pu: np.ndarray,
+    load_pu: np.ndarray,
+) -> float:
+    """
+    Compute the load the grid can deliver under a given build vector,
+    as the maximum flow from a super source feeding every plant to a
+    super sink draining every load. Existing lines always carry their
+    capacity, and each built line adds one more circuit on top.
+
+    :param np.ndarray start_idx: The start node index of each line.
+    :param np.ndarray end_idx: The end node index of each line.
+    :param np.ndarray capacity_pu: The per-unit capacity of each line.
+    :param np.ndarray is_real: Whether each line already exists.
+    :param np.ndarray build: The boolean build vector over the lines.
+    :param np.ndarray generation_pu: The per-unit generation capacity
+        of each node.
+    :param np.ndarray load_pu: The per-unit load of each node.
+    :return: The deliverable load in per-unit.
+    :rtype: float
+    """
+    node_count = load_pu.size
+    residual = np.zeros((node_count + 2, node_count + 2))
+
+    for i in range(start_idx.size):
+        capacity = 0.0
+
+        if is_real[i]:
+            capacity += capacity_pu[i]
+        if build[i]:
+            capacity += capacity_pu[i]
+
+        residual[start_idx[i], end_idx[i]] += capacity
+        residual[end_idx[i], start_idx[i]] += capacity
+
+    for node in range(node_count):
+        residual[node_count, node] = generation_pu[node]
+        residual[node, node_count + 1] = load_pu[node]
+
+    return _max_flow(residual, node_count, node_count + 1)
+
+
+@njit(cache=True, boundscheck=False)
+def _greedy_cover(
+    start_idx: np.ndarray,
+    end_idx: np.ndarray,
+    capital_cost: np.ndarray,
+    capacity_pu: np.ndarray,
+    is_real: np.ndarray,
+    generation_pu: np.ndarray,
+    load_pu: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute a feasible line-build cover: the cheapest lines needed to
+    connect the grid on top of the existing ones, then the cheapest
+    further circuits until the covered network can deliver every
+    node's load.
+
+    :param np.ndarray start_idx: The start node index of each line.
+    :param np.ndarray end_idx: The end node index of each line.
+    :param np.ndarray capital_cost: The capital cost of each line.
+    :param np.ndarray capacity_pu: The per-unit capacity of each line.
+    :param np.ndarray is_real: Whether each line already exists.
+    :param np.ndarray generation_pu: The per-unit generation capacity
+        of each node.
+    :param np.ndarray load_pu: The per-unit load of each node.
+    :return: The boolean build vector over the lines.
+    :rtype: np.ndarray
+    """
+    node_count = load_pu.size
+    build = np.zeros(start_idx.size, dtype=np.bool_)
+    parent = np.arange(node_count)
+    order = np.argsort(capital_cost)
+
+    # Existing lines connect their endpoints for free:
+    for i in range(start_idx.size):
+        if is_real[i]:
+            parent[_union_find_root(parent, start_idx[i])] = (
+                _union_find_root(parent, end_idx[i])
+            )
+
+    for i in order:
+        root_start = _union_find_root(parent, start_idx[i])
+        root_end = _union_find_root(parent, end_idx[i])
+
+        if root_start != root_end:
+            parent[root_start] = root_end
+            build[i] = True
+
+    # Keep building the cheapest circuits until the network has the
+    # transfer capacity to serve the full load:
+    total_load = load_pu.sum()
+
+    for i in order:
+        deliverable = _deliverable_load(
+            start_idx,
+            end_idx,
+            capacity_pu,
+            is_real,
+            build,
+            generation_pu,
+            load_pu,
+        )
+
+        if deliverable >= total_load - 1e-9:
+            break
+
+        build[i] = True
+
+    return build
+
 
 class System:
     """
@@ -18,30 +235,128 @@ class System:
     :param list[TransmissionLine] transmission_lines: The list of transmission
         lines in the system.
     :param float s_base: The base apparent power in MVA.
+    :param int presolve: The Gurobi presolve aggressiveness (0-2).
+        Default is 2.
+    :param int cuts: The Gurobi cut generation aggressiveness (0-3).
+        Default is 2.
+    :param int symmetry: The Gurobi symmetry detection level (0-2),
+        useful with many identical candidate lines. Default is 2.
+    :param int threads: The number of solver threads. Default is the
+        CPU count.
+    :param int method: The algorithm for the root LP relaxation.
+        Default is 2 (barrier).
+
+    For instances where warm-start incumbents are known, setting the
+    ``Heuristics`` parameter to 0.1 on ``self.model`` often helps too.
     """
 
     def __init__(
-        self, transmission_lines: list[TransmissionLine], s_base: float
+        self,
+        transmission_lines: list[TransmissionLine],
+        s_base: float,
+        *,
+        presolve: int = 2,
+        cuts: int = 2,
+        symmetry: int = 2,
+        threads: int | None = None,
+        method: int = 2,
     ) -> None:
         self.transmission_lines = transmission_lines
         self.s_base = s_base  # base apparent power in MVA
 
+        # Structure-of-arrays layout of the line attributes, computed
+        # once so every downstream pass is a contiguous numpy scan:
+        line_count = len(transmission_lines)
+
+        self._node_index = {node: i for i, node in enumerate(self.nodes)}
+        self._start_idx = np.fromiter(
+            (self._node_index[line.node_start] for line in
+             transmission_lines),
+            dtype=np.int32,
+            count=line_count,
+        )
+        self._end_idx = np.fromiter(
+            (self._node_index[line.node_end] for line in
+             transmission_lines),
+            dtype=np.int32,
+            count=line_count,
+        )
+        self._reactance = np.fromiter(
+            (line.reactance for line in transmission_lines),
+            dtype=np.float64,
+            count=line_count,
+        )
+        self._capacity = np.fromiter(
+            (line.capacity for line in transmission_lines),
+            dtype=np.float64,
+            count=line_count,
+        )
+        self._length = np.fromiter(
+            (line.length for line in transmission_lines),
+            dtype=np.float64,
+            count=line_count,
+        )
+        self._cost_per_mile = np.fromiter(
+            (line.cost_per_mile for line in transmission_lines),
+            dtype=np.float64,
+            count=line_count,
+        )
+        self._is_real = np.fromiter(
+            (line.is_real for line in transmission_lines),
+            dtype=np.bool_,
+            count=line_count,
+        )
+
+        # Derived line quantities, vectorized in one shot:
+        self._b = 1.0 / self._reactance
+        self._cap_pu = self._capacity / s_base
+        self._capital_cost = self._length * self._cost_per_mile
+
+        # Total load of each node in per-unit, aggregated once:
+        self._node_load_pu = (
+            np.array([node.total_load for node in self.nodes]) / s_base
+        )
+
         self.model = gb.Model()
 
+        # Solver tuning:
+        self.model.setParam("Presolve", presolve)
+        self.model.setParam("Cuts", cuts)
+        self.model.setParam("Symmetry", symmetry)
+        self.model.setParam(
+            "Threads", threads if threads is not None else os.cpu_count()
+        )
+        self.model.setParam("Method", method)
+
         self.expansion_cost = None
+        self.mip_gap = None
+
+        # Wall-clock split between model build and solver, so users can
+        # see which phase dominates:
+        self.build_time_s = None
+        self.solve_time_s = None
 
         # Variables:
-        self.line_control = None
-        self.line_control_vars_map = None
+        self.x = None
         self.generators = None
-        self.generator_vars_map = None
         self.theta = None
-        self.theta_vars_map = None
+        self.flow = None
+
+        # Sparse incidence matrices, built once per restrictions pass:
+        self._incidence = None
+        self._real_laplacian = None
+        self._plant_incidence = None
 
-    @property
+        # Nodal balance constraints, kept for in-place scenario updates:
+        self._node_constr = None
+
+    @cached_property
     def nodes(self) -> list[Node]:
         """
-        Get the list of nodes in the system.
+        Get the list of nodes in the system, ordered by ID.
+
+        Cached after the first access; invalidate with
+        ``del self.__dict__["nodes"]`` if the lines are ever mutated.
 
         :return: The list of nodes.
         :rtype: list[Node]
@@ -52,9 +367,9 @@ class System:
             unique_nodes.add(line.node_start)
             unique_nodes.add(line.node_end)
 
-        return unique_nodes
+        return sorted(unique_nodes, key=attrgetter("_id"))
 
-    @property
+    @cached_property
     def power_plants(self) -> list[PowerPlant]:
         """
         Get the list of power plants in the system.
@@ -70,7 +385,7 @@ class System:
 
         return power_plants
 
-    @property
+    @cached_property
     def transmission_line_count(self) -> int:
         """
         Get the count of transmission lines in the system.
@@ -80,7 +395,7 @@ class System:
         """
         return len(self.transmission_lines)
 
-    @property
+    @cached_property
     def node_count(self) -> int:
         """
         Get the count of nodes in the system.
@@ -90,7 +405,7 @@ class System:
         """
         return len(self.nodes)
 
-    @property
+    @cached_property
     def power_plant_count(self) -> int:
         """
         Get the count of power plants in the system.
@@ -107,168 +422,342 @@ class System:
         :return: The susceptance matrix.
         :rtype: np.ndarray
         """
-        return np.array(
-            [1 / line.reactance for line in self.transmission_lines]
-        )
+        return self._b
 
     def generate_variables(self) -> None:
         """
-        Generate the optimization variables.
+        Generate the optimization variables, as matrix-API variable
+        blocks added in a single call per block.
         """
-        # Dinary variables to indicate if transmission lines should be built
-        self.line_control = self.model.addVars(
-            [str(i) for i, _ in enumerate(self.transmission_lines)],
-            vtype=gb.GRB.BINARY,
+        line_count = self.transmission_line_count
+
+        # Binary variables to indicate if transmission lines should be built
+        self.x = self.model.addMVar(line_count, vtype=gb.GRB.BINARY)
+
+        # Adding variables for power plant generators, bounded by each
+        # plant's capacity so no explicit restriction rows are needed
+        capacity_pu = (
+            np.array([plant.capacity for plant in self.power_plants])
+            / self.s_base
+        )
+        self.generators = self.model.addMVar(
+            self.power_plant_count, lb=0.0, ub=capacity_pu
         )
-        self.line_control_vars_map = {
-            line: self.line_control[str(i)]
-            for i, line in enumerate(self.transmission_lines)
-        }
 
-        # Adding variables for power plant generators
-        self.generators = [
-            self.model.addVar() for _ in range(self.power_plant_count)
-        ]
-        self.generator_vars_map = dict(zip(self.power_plants, self.generators))
+        # Adding variables for the theta angles of each Node, bounded
+        # to one full turn
+        self.theta = self.model.addMVar(
+            self.node_count, lb=-np.pi, ub=np.pi
+        )
 
-        # Adding variables for the theta angles of each Node
-        self.theta = [self.model.addVar() for _ in range(self.node_count)]
-        self.theta_vars_map = dict(zip(self.nodes, self.theta))
+        # Adding variables for the power flow through candidate lines
+        self.flow = self.model.addMVar(line_count, lb=-gb.GRB.INFINITY)
 
-    def generate_power_plant_restrictions(self) -> None:
+    def generate_line_restrictions(self) -> None:
         """
-        Generate the power plant restrictions.
+        Generate the line restrictions, as vectorized constraint blocks
+        over the whole line set.
         """
-        for power_plant in self.power_plants:
-            capacity_pu = power_plant.capacity / self.s_base
+        susceptance = self._b
+        capacity_pu = self._cap_pu
 
-            self.model.addConstr(
-                self.generator_vars_map[power_plant] <= capacity_pu
-            )
-            self.model.addConstr(self.generator_vars_map[power_plant] >= 0)
+        delta_theta = (
+            self.theta[self._start_idx] - self.theta[self._end_idx]
+        )
 
-    def generate_angle_restrictions(self) -> None:
-        """
-        Generate the angle restrictions.
-        """
-        for angle in self.theta:
-            self.model.addConstr(angle <= np.pi)
-            self.model.addConstr(angle >= -np.pi)
+        # Candidate transmission lines, linearized with the big-M
+        # disjunction so that the model stays a pure MILP:
+        big_m = susceptance * 2 * np.pi + capacity_pu
 
-    def generate_line_restrictions(self) -> None:
-        """
-        Generate the line restrictions.
-        """
-        susceptance = self.get_susceptance_matrix()
+        self.model.addConstr(
+            -susceptance * delta_theta + big_m * self.x
+            <= capacity_pu + big_m
+        )
+        self.model.addConstr(
+            susceptance * delta_theta + big_m * self.x
+            <= capacity_pu + big_m
+        )
 
-        for i, line in enumerate(self.transmission_lines):
-            capacity_pu = line.capacity / self.s_base
+        # Flow definition, gated by the line control variable through the
+        # same big-M disjunction:
+        flow_m = susceptance * 2 * np.pi
 
-            theta_1 = self.theta_vars_map[line.node_start]
-            theta_2 = self.theta_vars_map[line.node_end]
+        self.model.addConstr(
+            self.flow - susceptance * delta_theta + flow_m * self.x
+            <= flow_m
+        )
+        self.model.addConstr(
+            susceptance * delta_theta - self.flow + flow_m * self.x
+            <= flow_m
+        )
+        self.model.addConstr(self.flow <= capacity_pu * self.x)
+        self.model.addConstr(-self.flow <= capacity_pu * self.x)
 
-            line_control_var = self.line_control_vars_map[line]
+        # Existing transmission lines:
+        if self._is_real.any():
+            real = np.flatnonzero(self._is_real)
 
-            # Candidate transmission lines:
             self.model.addConstr(
-                -susceptance[i] * (theta_1 - theta_2) * line_control_var
-                <= capacity_pu
+                -susceptance[real] * delta_theta[real] <= capacity_pu[real]
             )
             self.model.addConstr(
-                -susceptance[i] * (theta_2 - theta_1) * line_control_var
-                <= capacity_pu
+                susceptance[real] * delta_theta[real] <= capacity_pu[real]
             )
 
-            # Existing transmission lines:
-            if line.is_real:
-                self.model.addConstr(
-                    -susceptance[i] * (theta_1 - theta_2) <= capacity_pu
-                )
-                self.model.addConstr(
-                    -susceptance[i] * (theta_2 - theta_1) <= capacity_pu
-                )
-
     def generate_node_restrictions(self) -> None:
         """
-        Generate the node restrictions.
+        Generate the node restrictions as a single sparse matrix
+        equality over all nodes.
+        """
+        self._node_constr = self.model.addConstr(
+            self._plant_incidence @ self.generators
+            - self._incidence @ self.flow
+            - self._real_laplacian @ self.theta
+            == self._node_load_pu
+        )
+
+    def generate_incidence(self) -> None:
+        """
+        Build the sparse incidence matrices consumed by the node
+        restrictions: the node-line incidence over the flow variables,
+        the susceptance-weighted Laplacian of the existing lines, and
+        the node-plant incidence over the generator variables.
         """
         susceptance = self.get_susceptance_matrix()
+        line_range = np.arange(self.transmission_line_count)
+
+        # Every line, existing or not, routes its candidate flow
+        # variable into the balance: for an existing line the gated
+        # flow is a second, parallel circuit on the same corridor, on
+        # top of the unconditional term added through the Laplacian
+        # below. The two terms are therefore distinct circuits, not a
+        # duplicate of the same flow.
+        self._incidence = sp.coo_matrix(
+            (
+                np.concatenate(
+                    [
+                        np.ones(self.transmission_line_count),
+                        -np.ones(self.transmission_line_count),
+                    ]
+                ),
+                (
+                    np.concatenate([self._start_idx, self._end_idx]),
+                    np.concatenate([line_range, line_range]),
+                ),
+            ),
+            shape=(self.node_count, self.transmission_line_count),
+        ).tocsc()
+
+        # Existing lines contribute their susceptance-weighted angle
+        # difference unconditionally to both endpoint balances:
+        real = np.flatnonzero(self._is_real)
+        start_real = self._start_idx[real]
+        end_real = self._end_idx[real]
+        b_real = susceptance[real]
+
+        self._real_laplacian = sp.coo_matrix(
+            (
+                np.concatenate([b_real, -b_real, b_real, -b_real]),
+                (
+                    np.concatenate(
+                        [start_real, start_real, end_real, end_real]
+                    ),
+                    np.concatenate(
+                        [start_real, end_real, end_real, start_real]
+                    ),
+                ),
+            ),
+            shape=(self.node_count, self.node_count),
+        ).tocsc()
+
+        plant_rows = np.array(
+            [
+                self._node_index[node]
+                for node in self.nodes
+                for _ in node.power_plants
+            ]
+        )
+        self._plant_incidence = sp.coo_matrix(
+            (
+                np.ones(self.power_plant_count),
+                (plant_rows, np.arange(self.power_plant_count)),
+            ),
+            shape=(self.node_count, self.power_plant_count),
+        ).tocsc()
+
+    def generate_warm_start(self) -> None:
+        """
+        Seed the solver with a line-build cover: the cheapest circuits
+        needed to connect the grid on top of the existing lines,
+        extended greedily until the covered network has the transfer
+        capacity to deliver every node's load. The cover is asserted as
+        a partial MIP start — the remaining lines are left undefined so
+        Gurobi's start completion can add whatever DC flow physics
+        still requires — giving branch-and-bound an incumbent at the
+        root instead of searching for one.
+        """
+        generation_pu = (
+            np.array(
+                [node.total_generation_capacity for node in self.nodes]
+            )
+            / self.s_base
+        )
+
+        cover = _greedy_cover(
+            self._start_idx,
+            self._end_idx,
+            self._capital_cost,
+            self._cap_pu,
+            self._is_real,
+            generation_pu,
+            self._node_load_pu,
+        )
 
-        for _, node in enumerate(self.nodes):
-            generators = []
-            loads_pu = node.total_load / self.s_base
-
-            for power_plant in node.power_plants:
-                generators.append(self.generator_vars_map[power_plant])
-
-            line_terms = []
-
-            for i, line in enumerate(self.transmission_lines):
-                if line.node_start == node:
-                    line_terms.append(
-                        susceptance[i]
-                        * (
-                            self.theta_vars_map[line.node_start]
-                            - self.theta_vars_map[line.node_end]
-                        )
-                        * self.line_control_vars_map[line]
-                    )
-                    if line.is_real:
-                        line_terms.append(
-                            susceptance[i]
-                            * (
-                                self.theta_vars_map[line.node_start]
-                                - self.theta_vars_map[line.node_end]
-                            )
-                        )
-                elif line.node_end == node:
-                    line_terms.append(
-                        susceptance[i]
-                        * (
-                            self.theta_vars_map[line.node_end]
-                            - self.theta_vars_map[line.node_start]
-                        )
-                        * self.line_control_vars_map[line]
-                    )
-                    if line.is_real:
-                        line_terms.append(
-                            susceptance[i]
-                            * (
-                                self.theta_vars_map[line.node_end]
-                                - self.theta_vars_map[line.node_start]
-                            )
-                        )
+        self.x.Start = np.where(cover, 1.0, gb.GRB.UNDEFINED)
 
-            self.model.addConstr(
-                gb.quicksum(generators) - loads_pu - gb.quicksum(line_terms)
-                == 0
-            )
+    def warm_start_from(self, other_system: "System") -> None:
+        """
+        Copy the line-build solution of an already solved system into
+        this system's MIP start, for scenario sweeps over variants of
+        the same topology.
+
+        :param System other_system: A solved system with the same
+            transmission lines.
+        """
+        self.x.Start = other_system.x.X
 
     def generate_restrictions(self) -> None:
         """
         Generate all the restrictions.
         """
-        self.generate_power_plant_restrictions()
-        self.generate_angle_restrictions()
+        self.generate_incidence()
         self.generate_line_restrictions()
         self.generate_node_restrictions()
 
-    def optimize(self) -> None:
+    def compile(self) -> None:
         """
-        Optimize the power system.
-
-        :return: The optimized model.
-        :rtype: gb.Model
+        Build the full optimization model for the current topology:
+        variable blocks, sparse incidence matrices, restrictions, warm
+        start and objective. For a fixed set of nodes and lines this
+        runs once — the first optimize() call invokes it implicitly —
+        and subsequent scenarios only mutate the RHS or objective in
+        place before re-solving, so their cost is pure solver time.
+        The build wall-clock time is stored in ``build_time_s``.
         """
+        start = time.perf_counter()
+
         self.generate_variables()
         self.generate_restrictions()
+        self.generate_warm_start()
 
-        # Objective definition:
-        fob = gb.quicksum(
-            self.line_control[str(i)] * line.capital_cost
-            for i, line in enumerate(self.transmission_lines)
+        # Prioritize finding feasible solutions while branching, since
+        # an incumbent is already supplied by the warm start:
+        self.model.setParam("MIPFocus", 1)
+
+        # Objective definition, routed through the matrix API in a
+        # single call:
+        self.model.setObjective(
+            self._capital_cost @ self.x, sense=gb.GRB.MINIMIZE
         )
-        self.model.setObjective(fob, sense=gb.GRB.MINIMIZE)
+
+        # Parameters persisted by a previous tune() run:
+        if os.path.exists(PARAMETER_FILE):
+            self.model.read(PARAMETER_FILE)
+
+        self.build_time_s = time.perf_counter() - start
+
+    def tune(self, trials: int = 100) -> None:
+        """
+        Run Gurobi's parameter tuner on the compiled model and persist
+        the best parameter set to ``tep.prm``, which subsequent model
+        compilations pick up automatically. Worth running once on a
+        representative instance of a given topology.
+
+        :param int trials: The number of tuning trials. Default is 100.
+        """
+        if self.x is None:
+            self.compile()
+
+        self.model.setParam("TuneTrials", trials)
+        self.model.tune()
+
+        if self.model.tuneResultCount > 0:
+            self.model.getTuneResult(0)
+            self.model.write(PARAMETER_FILE)
+
+    def optimize(
+        self,
+        mip_gap: float | None = None,
+        heuristic_time: float | None = None,
+        time_limit: float | None = None,
+    ) -> None:
+        """
+        Optimize the power system.
+
+        :param float mip_gap: The relative MIP gap at which the solver
+            may stop instead of proving optimality. Default is Gurobi's.
+        :param float heuristic_time: Seconds to spend in the
+            no-relaxation heuristic before branching, which often finds
+            near-optimal builds quickly. Default is none.
+        :param float time_limit: Hard cap on the solve time in seconds,
+            for interactive sweeps. Default is none.
+        :return: The optimized model.
+        :rtype: gb.Model
+        """
+        if mip_gap is not None:
+            self.model.setParam("MIPGap", mip_gap)
+        if heuristic_time is not None:
+            self.model.setParam("NoRelHeurTime", heuristic_time)
+        if time_limit is not None:
+            self.model.setParam("TimeLimit", time_limit)
+
+        # The model is compiled once and reused by subsequent calls,
+        # which only re-solve after in-place scenario updates:
+        if self.x is None:
+            self.compile()
+
+        start = time.perf_counter()
         self.model.optimize()
+        self.solve_time_s = time.perf_counter() - start
+
+        # A time-limited or interrupted solve may stop without any
+        # incumbent, in which case no solution attributes exist:
+        if self.model.SolCount > 0:
+            self.expansion_cost = self.model.objVal
+            self.mip_gap = self.model.MIPGap
+
+            # Reuse this build vector as the incumbent of the next
+            # solve:
+            self.x.Start = self.x.X
+        else:
+            self.expansion_cost = None
+            self.mip_gap = None
+
+    def update_loads(self, new_loads: list[float]) -> None:
+        """
+        Update the nodal loads in place for a new scenario, keeping the
+        built model so the next optimize() call warm starts from the
+        previous solution.
+
+        :param list[float] new_loads: The new total load of each node,
+            in MVA, in the same order as ``nodes``.
+        """
+        self._node_load_pu = np.asarray(new_loads) / self.s_base
+
+        if self.x is not None:
+            self._node_constr.RHS = self._node_load_pu
+            self.model.update()
+
+    def update_costs(self, new_costs: list[float]) -> None:
+        """
+        Update the capital cost of each transmission line in place for
+        a new scenario, keeping the built model.
+
+        :param list[float] new_costs: The new capital cost of each
+            line, in the same order as ``transmission_lines``.
+        """
+        self._capital_cost = np.asarray(new_costs, dtype=np.float64)
 
-        self.expansion_cost = self.model.objVal
+        if self.x is not None:
+            self.x.Obj = self._capital_cost
+            self.model.update()